@@ -10,14 +10,14 @@ Security: P0/P1 critical fixes applied with documented limitations
 
 import json
 import csv
-import base64
+import binascii
 import os
 import re
 import urllib.parse
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
 from datetime import datetime, timedelta
-from collections import Counter
+from collections import Counter, OrderedDict, defaultdict
 import ast
 import operator
 import statistics
@@ -28,6 +28,9 @@ import tempfile
 import shutil
 import math
 import socket
+import threading
+import time
+import functools
 
 
 # ============================================================
@@ -40,12 +43,23 @@ MAX_EXPRESSION_LENGTH = 10000
 MAX_TEXT_LENGTH = 10000000  # 10MB
 MAX_DOWNLOAD_SIZE = 5000000  # 5MB for web_fetch
 MAX_ZIP_SIZE = 50000000  # 50MB for zip extraction
+MAX_ZIP_ENTRY_SIZE = 100000000  # 100MB uncompressed per zip entry
+MAX_ZIP_RATIO = 100  # max uncompressed/compressed ratio for entries over 1MB
 MAX_XML_SIZE = 20000000  # 20MB for XML files
 MAX_REGEX_TEXT_LENGTH = 200000  # 200KB for regex (reduced for safety)
 MAX_PATTERN_LENGTH = 200  # Max regex pattern length
+MAX_URL_CHARS = 2048  # extract_information: URLs longer than this after "://" are skipped
 MAX_CSV_EXCEL_SIZE = 50000000  # 50MB for CSV/Excel files
 MAX_XML_DEPTH = 200  # Maximum XML nesting depth
 MAX_XML_NODES = 100000  # Maximum XML nodes
+NUMBA_MIN_SIZE = 10000  # numeric inputs above which the optional Numba kernels are used
+VALIDATE_VECTORIZE_MIN_ROWS = 100000  # rows above which validate_data uses the pandas batch path (measured break-even ~20k-50k)
+MAX_TOOL_WORKERS = 8  # max concurrent network tool calls in call_tools
+API_CACHE_SIZE = 4096  # cached JSON responses for wikipedia/geocoding/currency lookups
+API_CACHE_TTL = 3600  # seconds (wikipedia, geocoding)
+CURRENCY_CACHE_TTL = 300  # seconds (exchange rates move faster)
+SERPER_URL = "https://google.serper.dev/search"
+SERPER_BATCH_SIZE = 100  # max queries per batched Serper request
 
 ALLOWED_SCHEMES = {'http', 'https'}
 ALLOWED_PORTS = {None, 80, 443}
@@ -53,6 +67,9 @@ ALLOWED_PORTS = {None, 80, 443}
 # SSRF 防護策略：DNS 失敗時是否放行（預設 fail-closed）
 STRICT_SSRF = os.getenv("STRICT_SSRF", "1") not in ("0", "false", "False")
 
+# OCR 引擎："tesseract"（預設）或 "rapidocr"（ONNX 模型常駐行程內，免每次啟動子行程；僅中英文）
+OCR_ENGINE = os.getenv("GAIA_OCR_ENGINE", "tesseract").lower()
+
 # API 域名白名單
 ALLOWED_API_DOMAINS = {
     'api.exchangerate-api.com',
@@ -62,6 +79,35 @@ ALLOWED_API_DOMAINS = {
 # Wikipedia 域名白名單
 WIKIPEDIA_DOMAIN_SUFFIX = '.wikipedia.org'
 
+# 輸入驗證用的預編譯正則
+_CURRENCY_RE = re.compile(r"[A-Z]{3}")
+_LANG_RE = re.compile(r"[a-z]{2,12}(?:-[a-z0-9]{2,12})?")
+# 量詞設上限（local part 64 / domain 253 / TLD 24）以避免 ReDoS 回溯
+_EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9.\-]{1,253}\.[A-Za-z]{2,24}\Z')
+
+# extract_information 用的預編譯正則
+_NUMBER_RE = re.compile(r'[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[eE][-+]?\d+)?')
+_DATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\d{4}-\d{2}-\d{2}',
+    r'\d{1,2}/\d{1,2}/\d{4}',
+    r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
+))
+# 網址字元類沒有重疊量詞（線性），整段取出後再依長度過濾：超長網址不比對，而不是回傳被截斷的前段
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+# email 量詞有上限；前後加邊界，超過長度的 email 不比對，而不是回傳被截斷的片段
+_EMAIL_FIND_RE = re.compile(
+    r'(?<![A-Za-z0-9._%+\-])[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9.\-]{1,253}\.[A-Za-z]{2,24}'
+    r'(?![A-Za-z]|[A-Za-z0-9.\-]*\.[A-Za-z]{2})'
+)
+_SENT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'\w+')
+
+# 巢狀量詞（如 (a+)+、(\w*)*）：典型 ReDoS 結構，不放入編譯快取
+_NESTED_QUANTIFIER_RE = re.compile(r'\([^()]*[+*}][^()]*\)\s*[+*{]')
+# re2 的 \w \d \s \b 只認 ASCII（\s 僅 [\t\n\f\r ]），與 Python str 正則語意不同的跳脫
+_UNICODE_ESCAPE_RE = re.compile(r'\\[wWdDsSbB]')
+_RE2_UNSAFE_CHARS_RE = re.compile(r'[^\x00-\x0a\x0c-\x1b\x20-\x7f]')  # 非 ASCII 與 \v、\x1c-\x1f
+
 # 完整的私有/保留 IP 範圍（包含特殊用途段）
 PRIVATE_IP_RANGES = [
     ipaddress.ip_network('0.0.0.0/8'),
@@ -89,14 +135,27 @@ PRIVATE_IP_RANGES = [
 # 輔助函數
 # ============================================================
 
+# 預建 encoder：與 json.dumps(sort_keys=True, ensure_ascii=False) 輸出相同，省去每次建構
+_KEYIFY_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+
 def _keyify(item: Any) -> str:
     """統一unhashable序列化"""
     try:
-        return json.dumps(item, sort_keys=True, ensure_ascii=False)
+        return _KEYIFY_ENCODER.encode(item)
     except Exception:
         return repr(item)
 
 
+def _df_records(df: Any) -> List[Dict[str, Any]]:
+    """
+    等同 df.to_dict('records')：逐欄 tolist() 後 zip 成 dict，
+    省去 pandas 逐格 boxing（大表約快 4-5 倍）
+    """
+    columns = list(df.columns)
+    return [dict(zip(columns, row)) for row in zip(*(df[c].tolist() for c in columns))]
+
+
 def _check_int_size(x: Any) -> None:
     """檢查整數大小"""
     if isinstance(x, int) and x.bit_length() > MAX_INT_BITS:
@@ -186,63 +245,316 @@ def _is_safe_url(url: str, domain_allowlist: Optional[set] = None) -> Tuple[bool
 def _safe_extract_zip(zip_ref: zipfile.ZipFile, extract_to: str, password: Optional[str] = None):
     """
     安全解壓 ZIP（防止 Zip Slip 和 Symlink 攻擊）
+    反斜線一律視為路徑分隔（寫回 info.filename，解壓位置與檔案清單一致），重複的項目名稱直接拒絕。
     """
     base = Path(extract_to).resolve()
+    members = zip_ref.infolist()
+    seen = set()
 
-    for info in zip_ref.infolist():
+    for info in members:
         # B1 修正：先檢查 symlink（在 is_dir 之前）
         if _is_zipinfo_symlink(info):
             raise ValueError(f"Symlink entry not allowed: {info.filename}")
-        
+
+        # POSIX 上 zipfile 不轉換反斜線，會寫出名稱含 "\" 的檔案；先正規化
+        name = info.filename.replace("\\", "/")
+        original = info.filename
+        info.filename = name
+
         # 跳過目錄
         if info.is_dir():
             continue
 
         # 防止絕對路徑、Windows 盤符、.. 穿越
-        name = info.filename.replace("\\", "/")
-        
         if name.startswith("/"):
-            raise ValueError(f"Absolute path in zip not allowed: {info.filename}")
+            raise ValueError(f"Absolute path in zip not allowed: {original}")
         
         if re.match(r"^[a-zA-Z]:", name):
-            raise ValueError(f"Drive letter in zip not allowed: {info.filename}")
+            raise ValueError(f"Drive letter in zip not allowed: {original}")
         
         dest = (base / name).resolve()
         if not _is_within_directory(str(base), str(dest)):
-            raise ValueError(f"Zip Slip detected: {info.filename}")
+            raise ValueError(f"Zip Slip detected: {original}")
+
+        # 同名項目（含正規化後相同者）解壓時會互相覆蓋，檔案清單也會重複列出
+        if dest in seen:
+            raise ValueError(f"Duplicate entry in zip not allowed: {original}")
+        seen.add(dest)
 
-    # 檢查完畢後再 extract
+    # 檢查完畢後再 extract（傳入 ZipInfo，使用正規化後的名稱）
     if password:
-        zip_ref.extractall(extract_to, pwd=password.encode())
+        zip_ref.extractall(extract_to, members=members, pwd=password.encode())
     else:
-        zip_ref.extractall(extract_to)
+        zip_ref.extractall(extract_to, members=members)
+
+
+def _check_zip_bomb(infos: List[zipfile.ZipInfo]) -> Optional[str]:
+    """解壓前依 infolist 檢查總大小、單檔大小與壓縮比（回傳錯誤訊息或 None）"""
+    total_size = 0
+    for info in infos:
+        total_size += info.file_size
+        if info.file_size > MAX_ZIP_ENTRY_SIZE:
+            return f"Zip entry too large: {info.filename} (potential zip bomb)"
+        if (info.file_size > 1000000 and info.compress_size
+                and info.file_size / info.compress_size > MAX_ZIP_RATIO):
+            return f"Suspicious compression ratio: {info.filename} (potential zip bomb)"
+    if total_size > MAX_ZIP_SIZE * 10:
+        return "Uncompressed size too large (potential zip bomb)"
+    return None
+
+
+_HTTP_ADAPTER: Any = None  # 所有 session 共用的連線池（keep-alive 跨呼叫重用）
 
 
 def _create_safe_session() -> Any:
-    """創建安全的 requests session（禁用環境代理）"""
+    """
+    創建安全的 requests session（禁用環境代理）。
+    session 每次新建（cookie 不跨呼叫），但掛上共用的 HTTPAdapter 以重用 TCP/TLS 連線。
+    """
+    global _HTTP_ADAPTER
     try:
         import requests
-        session = requests.Session()
-        session.trust_env = False
-        return session
+        from requests.adapters import HTTPAdapter
     except ImportError:
         return None
+    if _HTTP_ADAPTER is None:
+        _HTTP_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session = requests.Session()
+    session.trust_env = False
+    session.mount("https://", _HTTP_ADAPTER)
+    session.mount("http://", _HTTP_ADAPTER)
+    return session
+
 
+_API_CACHE: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+_API_CACHE_LOCK = threading.Lock()
 
-def _build_line_index(text: str) -> List[int]:
-    """預建行索引"""
-    line_starts = [0]
-    for i, char in enumerate(text):
-        if char == '\n':
-            line_starts.append(i + 1)
+
+def _get_json_cached(url: str, ttl: float, params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Any:
+    """
+    GET 並解析 JSON，行程內 TTL + LRU 快取（只快取成功回應）。
+    回傳的物件為共用快取內容，呼叫端只讀不改。
+    """
+    key = (url, tuple(sorted(params.items())) if params else ())
+    now = time.monotonic()
+    with _API_CACHE_LOCK:
+        hit = _API_CACHE.get(key)
+        if hit is not None:
+            if hit[0] > now:
+                _API_CACHE.move_to_end(key)
+                return hit[1]
+            del _API_CACHE[key]
+
+    import requests
+    session = _create_safe_session() or requests.Session()
+    response = session.get(url, params=params, headers=headers, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+
+    with _API_CACHE_LOCK:
+        _API_CACHE[key] = (now + ttl, data)
+        _API_CACHE.move_to_end(key)
+        while len(_API_CACHE) > API_CACHE_SIZE:
+            _API_CACHE.popitem(last=False)
+    return data
+
+
+def _build_line_index(text: str) -> Any:
+    """
+    預建行索引（各行起始位置）。
+    有 numpy 時向量化找出換行；非 ASCII 以 UTF-32 編碼保持字元位移。
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        line_starts = [0]
+        find = text.find
+        pos = find('\n')
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        return line_starts
+
+    if text.isascii():
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    newlines = np.flatnonzero(codes == 0x0A)
+    line_starts = np.empty(newlines.size + 1, dtype=np.int64)
+    line_starts[0] = 0
+    line_starts[1:] = newlines + 1
     return line_starts
 
 
-def _find_line_number(position: int, line_starts: List[int]) -> int:
-    """二分查找行號"""
-    import bisect
-    idx = bisect.bisect_right(line_starts, position)
-    return idx
+def _find_line_numbers(positions: List[int], line_starts: Any) -> List[int]:
+    """批次二分查找行號"""
+    if isinstance(line_starts, list):
+        import bisect
+        return [bisect.bisect_right(line_starts, pos) for pos in positions]
+    import numpy as np
+    return np.searchsorted(line_starts, positions, side='right').tolist()
+
+
+_NUMBA_KERNELS: Any = None  # None = 尚未載入, False = 不可用
+
+
+def _numba_kernels() -> Any:
+    """延遲載入 gaia_numba_kernels（numba/numpy 不存在時回傳 None）"""
+    global _NUMBA_KERNELS
+    if _NUMBA_KERNELS is None:
+        try:
+            import gaia_numba_kernels
+            _NUMBA_KERNELS = gaia_numba_kernels
+        except ImportError:
+            _NUMBA_KERNELS = False
+    return _NUMBA_KERNELS or None
+
+
+@functools.lru_cache(maxsize=256)
+def _word_boundary_re(term: str) -> "re.Pattern":
+    """整詞比對（前後 word boundary）的預編譯正則（快取）"""
+    return re.compile(r'\b' + re.escape(term) + r'\b')
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_cached_pattern(pattern: str, flags: int) -> "re.Pattern":
+    """使用者正則快取；容量大於 re 模組內建的 512 筆，避免交錯使用時被擠出"""
+    return re.compile(pattern, flags)
+
+
+def _compile_re2(pattern: str) -> Any:
+    """以 google-re2 編譯（線性時間）；未安裝或語法不支援（backref/lookaround）時回傳 None"""
+    try:
+        import re2
+    except ImportError:
+        return None
+    options = re2.Options()
+    options.log_errors = False
+    try:
+        return re2.compile(pattern, options)
+    except re2.error:
+        return None
+
+
+def _compile_user_pattern(pattern: str, text: str, flags: int = 0) -> "re.Pattern":
+    """
+    編譯使用者正則（LRU 快取）。
+    含巢狀量詞者優先交給 re2（無災難性回溯），否則每次以 re 重新編譯、不留在快取中。
+    re2 的字元類只認 ASCII：樣式含 \\w \\d \\s \\b 等跳脫時，僅在 text 不含非 ASCII
+    （及 \\v、\\x1c-\\x1f 空白）字元時才使用 re2，以保持與 re 相同的比對結果。
+    """
+    if _NESTED_QUANTIFIER_RE.search(pattern):
+        use_re2 = not flags and (not _UNICODE_ESCAPE_RE.search(pattern)
+                                 or not _RE2_UNSAFE_CHARS_RE.search(text))
+        compiled = _compile_re2(pattern) if use_re2 else None
+        return compiled if compiled is not None else re.compile(pattern, flags)
+    return _compile_cached_pattern(pattern, flags)
+
+
+@functools.lru_cache(maxsize=64)
+def _hyperscan_db(terms: Tuple[str, ...]) -> Any:
+    """字面詞組的 Hyperscan 資料庫（快取；未安裝 hyperscan 時回傳 None）"""
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    db = hyperscan.Database()
+    # 逐位元組 \xHH 轉義，字面比對不受正則特殊字元影響
+    expressions = [''.join('\\x%02x' % b for b in t.encode()).encode() for t in terms]
+    db.compile(expressions=expressions, ids=list(range(len(terms))), elements=len(terms),
+               flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(terms))
+    return db
+
+
+def _hyperscan_buckets(text: str, unique_terms: List[str], first_term: str,
+                       max_results: int) -> Optional[Dict[str, List[int]]]:
+    """
+    以 Hyperscan 單次掃描收集每個詞的非重疊位置（每詞最多 max_results 筆）。
+    僅處理 ASCII（位元組位移即字元位移）；不適用或未安裝時回傳 None。
+    """
+    if not text.isascii() or not all(t.isascii() for t in unique_terms):
+        return None
+    db = _hyperscan_db(tuple(unique_terms))
+    if db is None:
+        return None
+    import hyperscan
+
+    buckets = {t: [] for t in unique_terms}
+    next_free = [0] * len(unique_terms)
+    first = buckets[first_term]
+
+    def on_match(idx, start, end, flags, context):
+        bucket = buckets[unique_terms[idx]]
+        if start < next_free[idx] or len(bucket) >= max_results:
+            return False
+        bucket.append(start)
+        next_free[idx] = end
+        # 回傳 True 讓 Hyperscan 停止掃描
+        return len(first) >= max_results
+
+    try:
+        db.scan(text.encode('ascii'), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    except hyperscan.error:
+        # 例如多執行緒同時使用同一個快取 db 的 scratch，改走其他掃描方式
+        return None
+    return buckets
+
+
+def _iter_term_positions(text: str, terms: List[str], max_results: int):
+    """
+    依 terms 順序產生 (term, pos)，與逐詞 re.finditer 的非重疊結果一致。
+    依序嘗試 Hyperscan、pyahocorasick 單次多詞掃描，皆不可用時逐詞 str.find。
+    """
+    unique_terms = list(dict.fromkeys(terms))
+    if unique_terms and '' not in unique_terms:
+        buckets = _hyperscan_buckets(text, unique_terms, terms[0], max_results)
+        if buckets is not None:
+            for term in terms:
+                for pos in buckets[term]:
+                    yield term, pos
+            return
+
+    automaton = None
+    if unique_terms and '' not in unique_terms:
+        try:
+            import ahocorasick
+            automaton = ahocorasick.Automaton()
+            for t in unique_terms:
+                automaton.add_word(t, t)
+            automaton.make_automaton()
+        except ImportError:
+            automaton = None
+
+    if automaton is None:
+        # 字面詞直接用 str.find 逐段推進（非重疊），不經過正則引擎
+        for term in terms:
+            step = len(term) or 1
+            pos = text.find(term)
+            while pos != -1:
+                yield term, pos
+                pos = text.find(term, pos + step)
+        return
+
+    # 每個詞最多只需要 max_results 筆；第一個詞額滿即可提前結束
+    buckets = {t: [] for t in unique_terms}
+    next_free = dict.fromkeys(unique_terms, 0)
+    first = buckets[terms[0]]
+    for end, t in automaton.iter(text):
+        pos = end - len(t) + 1
+        bucket = buckets[t]
+        if pos < next_free[t] or len(bucket) >= max_results:
+            continue
+        bucket.append(pos)
+        next_free[t] = pos + len(t)
+        if len(first) >= max_results:
+            break
+
+    for term in terms:
+        for pos in buckets[term]:
+            yield term, pos
 
 
 def _rankdata(values: List[float]) -> List[float]:
@@ -283,17 +595,17 @@ def read_pdf(file_path: str, page_numbers: Optional[List[int]] = None) -> Dict[s
                     "creator": pdf_reader.metadata.get("/Creator", "")
                 }
 
-            content = ""
+            # 逐頁收集後一次 join，避免長文件反覆字串串接
+            parts = []
             if page_numbers:
                 for page_num in page_numbers:
                     if 1 <= page_num <= total_pages:
                         page = pdf_reader.pages[page_num - 1]
-                        txt = page.extract_text() or ""
-                        content += txt + "\n\n"
+                        parts.append(page.extract_text() or "")
             else:
                 for page in pdf_reader.pages:
-                    txt = page.extract_text() or ""
-                    content += txt + "\n\n"
+                    parts.append(page.extract_text() or "")
+            content = "".join(txt + "\n\n" for txt in parts)
 
         return {
             "success": True,
@@ -336,51 +648,115 @@ def web_search(query: str, num_results: int = 5) -> Dict[str, Any]:
         }
 
     try:
-        import requests
-        url = "https://google.serper.dev/search"
-        payload = json.dumps({"q": query, "num": num_results})
-        headers = {
-            'X-API-KEY': api_key,
-            'Content-Type': 'application/json'
-        }
+        data = _serper_search(api_key, query, num_results)
+        return _serper_result(query, num_results, data)
+    except Exception as e:
+        return _serper_error(query, e)
+
+
+_SERPER_INFLIGHT: Dict[Tuple[str, int], Any] = {}
+_SERPER_INFLIGHT_LOCK = threading.Lock()
 
-        session = _create_safe_session()
-        if session:
-            response = session.post(url, headers=headers, data=payload, timeout=10)
+
+def _serper_post(api_key: str, payload: Any) -> Any:
+    """POST 至 Serper；payload 為單一查詢 dict 或批次 list。"""
+    import requests
+    headers = {
+        'X-API-KEY': api_key,
+        'Content-Type': 'application/json'
+    }
+    session = _create_safe_session()
+    if session:
+        response = session.post(SERPER_URL, headers=headers, data=json.dumps(payload), timeout=10)
+    else:
+        response = requests.post(SERPER_URL, headers=headers, data=json.dumps(payload), timeout=10,
+                                 proxies={"http": None, "https": None})
+    response.raise_for_status()
+    return response.json()
+
+
+def _serper_search(api_key: str, query: str, num_results: int) -> Any:
+    """
+    單一查詢；同一 (query, num_results) 已在送出中時，直接等待該次結果（不重複計費）。
+    """
+    from concurrent.futures import Future
+
+    key = (query, num_results)
+    with _SERPER_INFLIGHT_LOCK:
+        pending = _SERPER_INFLIGHT.get(key)
+        if pending is None:
+            pending = _SERPER_INFLIGHT[key] = Future()
+            owner = True
         else:
-            response = requests.post(url, headers=headers, data=payload, timeout=10, 
-                                    proxies={"http": None, "https": None})
-        response.raise_for_status()
-
-        data = response.json()
-        results = []
-
-        for item in data.get("organic", [])[:num_results]:
-            results.append({
-                "title": item.get("title", ""),
-                "url": item.get("link", ""),
-                "snippet": item.get("snippet", "")
-            })
+            owner = False
+    if not owner:
+        return pending.result()
+
+    try:
+        data = _serper_post(api_key, {"q": query, "num": num_results})
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    else:
+        pending.set_result(data)
+        return data
+    finally:
+        with _SERPER_INFLIGHT_LOCK:
+            del _SERPER_INFLIGHT[key]
+
+
+def _serper_result(query: str, num_results: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    """將 Serper 回應轉為 web_search 結果格式。"""
+    results = [
+        {
+            "title": item.get("title", ""),
+            "url": item.get("link", ""),
+            "snippet": item.get("snippet", "")
+        }
+        for item in data.get("organic", [])[:num_results]
+    ]
+    return {
+        "success": True,
+        "results": results,
+        "query": query,
+        "count": len(results),
+        "provider": "Serper (Google)",
+        "is_simulated": False,
+        "error": None
+    }
+
+
+def _serper_error(query: str, e: Exception) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "results": [],
+        "query": query,
+        "count": 0,
+        "provider": "Serper",
+        "is_simulated": False,
+        "error": str(e)
+    }
 
-        return {
-            "success": True,
-            "results": results,
-            "query": query,
-            "count": len(results),
-            "provider": "Serper (Google)",
-            "is_simulated": False,
-            "error": None
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "results": [],
-            "query": query,
-            "count": 0,
-            "provider": "Serper",
-            "is_simulated": False,
-            "error": str(e)
-        }
+
+def _web_search_batch(queries: List[Tuple[str, int]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    多個 web_search 合併為 Serper 批次請求（每批最多 SERPER_BATCH_SIZE 筆，一次往返）。
+    無 API key 或批次失敗時回傳 None，由呼叫端改走逐筆路徑。
+    """
+    api_key = os.environ.get("SERPER_API_KEY")
+    if not api_key:
+        return None
+    out: List[Dict[str, Any]] = []
+    try:
+        for start in range(0, len(queries), SERPER_BATCH_SIZE):
+            chunk = queries[start:start + SERPER_BATCH_SIZE]
+            data = _serper_post(api_key, [{"q": q, "num": n} for q, n in chunk])
+            if not isinstance(data, list) or len(data) != len(chunk):
+                return None
+            out.extend(_serper_result(q, n, d) for (q, n), d in zip(chunk, data))
+    except Exception:
+        return None
+    return out
 
 
 def read_csv(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
@@ -401,7 +777,7 @@ def read_csv(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
         df = pd.read_csv(file_path, encoding=encoding)
         return {
             "success": True,
-            "data": df.to_dict('records'),
+            "data": _df_records(df),
             "columns": list(df.columns),
             "rows": len(df),
             "error": None
@@ -420,15 +796,16 @@ def read_image(file_path: str) -> Dict[str, Any]:
     """Read image file."""
     try:
         from PIL import Image
-        img = Image.open(file_path)
-        return {
-            "success": True,
-            "format": img.format,
-            "mode": img.mode,
-            "width": img.width,
-            "height": img.height,
-            "error": None
-        }
+        # Image.open 只解析檔頭，不解碼像素；用 with 確保檔案控制代碼關閉
+        with Image.open(file_path) as img:
+            return {
+                "success": True,
+                "format": img.format,
+                "mode": img.mode,
+                "width": img.width,
+                "height": img.height,
+                "error": None
+            }
     except Exception as e:
         return {
             "success": False,
@@ -440,75 +817,83 @@ def read_image(file_path: str) -> Dict[str, Any]:
         }
 
 
-def calculate(expression: str) -> Dict[str, Any]:
-    """Safe math expression evaluator with pow estimation and finite check."""
-    try:
-        if len(expression) > MAX_EXPRESSION_LENGTH:
-            raise ValueError(f"Expression too long (max {MAX_EXPRESSION_LENGTH})")
+_CALC_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+}
 
-        allowed_operators = {
-            ast.Add: operator.add,
-            ast.Sub: operator.sub,
-            ast.Mult: operator.mul,
-            ast.Div: operator.truediv,
-            ast.Pow: operator.pow,
-            ast.USub: operator.neg,
-        }
-
-        def eval_node(node):
-            if isinstance(node, ast.Constant):
-                if not isinstance(node.value, (int, float)):
-                    raise ValueError("Only numeric constants allowed")
-                _check_int_size(node.value)
-                return node.value
-
-            elif isinstance(node, ast.Num):
-                _check_int_size(node.n)
-                return node.n
-
-            elif isinstance(node, ast.BinOp):
-                left = eval_node(node.left)
-                right = eval_node(node.right)
-                op_type = type(node.op)
-
-                if op_type not in allowed_operators:
-                    raise ValueError(f"Unsupported operator: {op_type.__name__}")
-
-                if op_type is ast.Pow:
-                    if not isinstance(right, (int, float)):
-                        raise ValueError("Exponent must be numeric")
-                    if abs(right) > MAX_POW_EXP:
-                        raise ValueError(f"Exponent too large (max {MAX_POW_EXP})")
-
-                    if isinstance(left, int) and isinstance(right, int) and right >= 0:
-                        est_bits = left.bit_length() * right
-                        if est_bits > MAX_INT_BITS:
-                            raise ValueError(f"Power result too large (est {est_bits} bits)")
-
-                result = allowed_operators[op_type](left, right)
-                
-                if isinstance(result, float) and not math.isfinite(result):
-                    raise ValueError("Non-finite result (inf/nan)")
-                
-                _check_int_size(result)
-                return result
 
-            elif isinstance(node, ast.UnaryOp):
-                operand = eval_node(node.operand)
-                op_type = type(node.op)
+def _eval_calc_node(node: Any) -> Any:
+    """calculate 的 AST 求值（僅允許數值常數與四則/次方運算）"""
+    if isinstance(node, ast.Constant):
+        if not isinstance(node.value, (int, float)):
+            raise ValueError("Only numeric constants allowed")
+        _check_int_size(node.value)
+        return node.value
 
-                if op_type not in allowed_operators:
-                    raise ValueError(f"Unsupported unary operator: {op_type.__name__}")
+    elif isinstance(node, ast.Num):
+        _check_int_size(node.n)
+        return node.n
 
-                result = allowed_operators[op_type](operand)
-                _check_int_size(result)
-                return result
+    elif isinstance(node, ast.BinOp):
+        left = _eval_calc_node(node.left)
+        right = _eval_calc_node(node.right)
+        op_type = type(node.op)
 
-            else:
-                raise ValueError("Unsupported operation")
+        if op_type not in _CALC_OPERATORS:
+            raise ValueError(f"Unsupported operator: {op_type.__name__}")
+
+        if op_type is ast.Pow:
+            if not isinstance(right, (int, float)):
+                raise ValueError("Exponent must be numeric")
+            if abs(right) > MAX_POW_EXP:
+                raise ValueError(f"Exponent too large (max {MAX_POW_EXP})")
+
+            if isinstance(left, int) and isinstance(right, int) and right >= 0:
+                est_bits = left.bit_length() * right
+                if est_bits > MAX_INT_BITS:
+                    raise ValueError(f"Power result too large (est {est_bits} bits)")
+
+        result = _CALC_OPERATORS[op_type](left, right)
+
+        if isinstance(result, float) and not math.isfinite(result):
+            raise ValueError("Non-finite result (inf/nan)")
+
+        _check_int_size(result)
+        return result
+
+    elif isinstance(node, ast.UnaryOp):
+        operand = _eval_calc_node(node.operand)
+        op_type = type(node.op)
+
+        if op_type not in _CALC_OPERATORS:
+            raise ValueError(f"Unsupported unary operator: {op_type.__name__}")
+
+        result = _CALC_OPERATORS[op_type](operand)
+        _check_int_size(result)
+        return result
+
+    else:
+        raise ValueError("Unsupported operation")
 
-        tree = ast.parse(expression, mode='eval')
-        result = eval_node(tree.body)
+
+@functools.lru_cache(maxsize=2048)
+def _evaluate_expression(expression: str) -> Union[int, float]:
+    """解析並計算算式；只有常數運算，相同字串結果必相同，可直接快取"""
+    return _eval_calc_node(ast.parse(expression, mode='eval').body)
+
+
+def calculate(expression: str) -> Dict[str, Any]:
+    """Safe math expression evaluator with pow estimation and finite check."""
+    try:
+        if len(expression) > MAX_EXPRESSION_LENGTH:
+            raise ValueError(f"Expression too long (max {MAX_EXPRESSION_LENGTH})")
+
+        result = _evaluate_expression(expression)
 
         return {
             "success": True,
@@ -540,14 +925,21 @@ def read_excel(file_path: str, sheet_name: Optional[str] = None) -> Dict[str, An
             }
         
         import pandas as pd
+        # 優先使用 calamine（Rust 解析器，比 openpyxl/xlrd 快一個數量級）
+        try:
+            import python_calamine
+            engine = "calamine"
+        except ImportError:
+            engine = None
+
         if sheet_name:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+            df = pd.read_excel(file_path, sheet_name=sheet_name, engine=engine)
         else:
-            df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path, engine=engine)
 
         return {
             "success": True,
-            "data": df.to_dict('records'),
+            "data": _df_records(df),
             "columns": list(df.columns),
             "rows": len(df),
             "error": None
@@ -562,9 +954,35 @@ def read_excel(file_path: str, sheet_name: Optional[str] = None) -> Dict[str, An
         }
 
 
+_RAPID_OCR: Any = None  # None = 尚未載入, False = 不可用
+
+
+def _rapid_ocr() -> Any:
+    """延遲建立 RapidOCR 單例（模型只載入一次；未安裝時回傳 None）"""
+    global _RAPID_OCR
+    if _RAPID_OCR is None:
+        try:
+            from rapidocr_onnxruntime import RapidOCR
+            _RAPID_OCR = RapidOCR()
+        except ImportError:
+            _RAPID_OCR = False
+    return _RAPID_OCR or None
+
+
 def image_to_text(file_path: str, lang: str = "eng") -> Dict[str, Any]:
     """OCR text extraction."""
     try:
+        if OCR_ENGINE == "rapidocr" and lang in ("eng", "chi_sim", "chi_tra"):
+            engine = _rapid_ocr()
+            if engine is not None:
+                result, _ = engine(file_path)
+                text = "\n".join(line[1] for line in result or [])
+                return {
+                    "success": True,
+                    "text": text.strip(),
+                    "error": None
+                }
+
         import pytesseract
         from PIL import Image
         img = Image.open(file_path)
@@ -706,13 +1124,12 @@ def filter_data(data: List[Dict], conditions: Dict[str, Any]) -> Dict[str, Any]:
     try:
         original_count = len(data)
         filtered = []
+        items = list(conditions.items())
         for item in data:
-            match = True
-            for key, value in conditions.items():
+            for key, value in items:
                 if key not in item or item[key] != value:
-                    match = False
                     break
-            if match:
+            else:
                 filtered.append(item)
 
         return {
@@ -774,7 +1191,7 @@ def read_text_file(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
         return {
             "success": True,
             "content": content,
-            "lines": len(content.split('\n')),
+            "lines": content.count('\n') + 1,
             "characters": len(content),
             "error": None
         }
@@ -814,7 +1231,12 @@ def aggregate_data(data: List[Dict], group_by: str,
     """Aggregate data."""
     try:
         import pandas as pd
-        df = pd.DataFrame(data)
+        # 只建立用得到的兩欄（缺值補 NaN），不把整份 list of dicts 轉成 DataFrame
+        columns = dict.fromkeys((group_by, aggregate_field))
+        df = pd.DataFrame({
+            col: [item.get(col, math.nan) for item in data]
+            for col in columns if any(col in item for item in data)
+        })
 
         if operation == "sum":
             result = df.groupby(group_by)[aggregate_field].sum()
@@ -870,23 +1292,33 @@ def sort_data(data: List[Dict], sort_by: str,
         }
 
 
+# 每通道皆為無號 8 位元的多通道模式（LAB 的 a/b 在 numpy 中為有號，不列入）
+_UINT8_MULTIBAND_MODES = frozenset({"RGB", "RGBA", "RGBX", "RGBa", "CMYK", "YCbCr", "HSV", "LA", "La", "PA"})
+
+
 def analyze_image(file_path: str) -> Dict[str, Any]:
     """Analyze image properties."""
     try:
         from PIL import Image
-        import numpy as np
 
-        img = Image.open(file_path)
-        img_array = np.array(img)
+        with Image.open(file_path) as img:
+            if img.mode in _UINT8_MULTIBAND_MODES:
+                # 由 C 層直方圖算各通道平均，免複製整張 numpy 陣列；結果與 ndarray.mean 完全相同
+                from PIL import ImageStat
+                mean_color = ImageStat.Stat(img).mean
+            else:
+                import numpy as np
+                img_array = np.array(img)
+                mean_color = img_array.mean(axis=(0,1)).tolist() if len(img_array.shape) == 3 else None
 
-        return {
-            "success": True,
-            "format": img.format,
-            "mode": img.mode,
-            "size": img.size,
-            "mean_color": img_array.mean(axis=(0,1)).tolist() if len(img_array.shape) == 3 else None,
-            "error": None
-        }
+            return {
+                "success": True,
+                "format": img.format,
+                "mode": img.mode,
+                "size": img.size,
+                "mean_color": mean_color,
+                "error": None
+            }
     except Exception as e:
         return {
             "success": False,
@@ -1079,20 +1511,20 @@ def join_data(
                 result.append(merged)
 
         elif join_type == "outer":
-            processed_keys = set()
+            remaining = set(data2_dict)
             for item1 in data1:
                 key = item1.get(join_key)
                 if key is not None and key in data2_dict:
-                    merged = {**item1, **data2_dict[key]}
+                    merged = item1.copy()
+                    merged.update(data2_dict[key])
                     result.append(merged)
-                    processed_keys.add(key)
+                    remaining.discard(key)
                 else:
                     result.append(item1)
 
-            for item2 in data2:
-                key = item2.get(join_key)
-                if key is not None and key not in processed_keys:
-                    result.append(item2)
+            # data2_dict 保留 data2 的插入順序
+            if remaining:
+                result.extend(item2 for k, item2 in data2_dict.items() if k in remaining)
 
         return_dict = {
             "success": True,
@@ -1134,8 +1566,9 @@ def deduplicate_data(
         else:
             seen = set()
             result = []
+            fields = tuple(key_fields)
             for item in data:
-                key = tuple(item.get(field) for field in key_fields)
+                key = tuple([item.get(field) for field in fields])
                 if key not in seen:
                     seen.add(key)
                     result.append(item)
@@ -1164,6 +1597,15 @@ def deduplicate_data(
         }
 
 
+_PIVOT_AGGFUNCS = {
+    "sum": sum,
+    "mean": lambda vals: sum(vals) / len(vals),
+    "count": len,
+    "min": min,
+    "max": max,
+}
+
+
 def pivot_table(
     data: List[Dict[str, Any]],
     index: str,
@@ -1172,30 +1614,22 @@ def pivot_table(
 ) -> Dict[str, Any]:
     """Create pivot table."""
     try:
-        grouped = {}
+        agg = _PIVOT_AGGFUNCS.get(aggfunc)
+        if agg is None:
+            raise ValueError(f"Unsupported aggfunc: {aggfunc}")
+
+        grouped = defaultdict(list)
+        _float = float
         for item in data:
             key = item.get(index)
-            if key is not None:
-                if key not in grouped:
-                    grouped[key] = []
-                value = item.get(values)
-                if value is not None:
-                    grouped[key].append(float(value))
-
-        result = {}
-        for key, vals in grouped.items():
-            if aggfunc == "sum":
-                result[key] = sum(vals)
-            elif aggfunc == "mean":
-                result[key] = sum(vals) / len(vals)
-            elif aggfunc == "count":
-                result[key] = len(vals)
-            elif aggfunc == "min":
-                result[key] = min(vals)
-            elif aggfunc == "max":
-                result[key] = max(vals)
-            else:
-                raise ValueError(f"Unsupported aggfunc: {aggfunc}")
+            if key is None:
+                continue
+            vals = grouped[key]
+            value = item.get(values)
+            if value is not None:
+                vals.append(_float(value))
+
+        result = {key: agg(vals) for key, vals in grouped.items()}
 
         return {
             "success": True,
@@ -1304,11 +1738,11 @@ def sample_data(
     try:
         import random
 
-        if random_seed is not None:
-            random.seed(random_seed)
+        # 使用獨立 RNG 實例，不動到全域 random 狀態
+        rng = random.Random(random_seed)
 
         sample_size = min(n, len(data))
-        sampled = random.sample(data, sample_size)
+        sampled = rng.sample(data, sample_size)
 
         return {
             "success": True,
@@ -1359,10 +1793,11 @@ def regex_search(
                 "error": f"Text too large for regex (max {MAX_REGEX_TEXT_LENGTH})"
             }
 
+        compiled = _compile_user_pattern(pattern, text)
         if return_all:
-            matches = re.findall(pattern, text)
+            matches = compiled.findall(text)
         else:
-            match = re.search(pattern, text)
+            match = compiled.search(text)
             matches = [match.group()] if match else []
 
         return {
@@ -1434,10 +1869,10 @@ def encode_decode(
     """Encode/decode text with error handling."""
     try:
         if operation == "base64_encode":
-            result = base64.b64encode(text.encode()).decode()
+            result = binascii.b2a_base64(text.encode('utf-8'), newline=False).decode('ascii')
         elif operation == "base64_decode":
+            decoded_bytes = binascii.a2b_base64(text)
             try:
-                decoded_bytes = base64.b64decode(text.encode())
                 result = decoded_bytes.decode('utf-8')
             except UnicodeDecodeError:
                 result = decoded_bytes.hex()
@@ -1519,8 +1954,19 @@ def statistical_analysis(
     try:
         results = {}
 
+        # 大量 float 資料：mean/std/variance 以 Numba 兩次掃描取代 statistics 的精確分數運算
+        moments = None
+        if ("mean" in metrics or "std" in metrics or "stdev" in metrics or "variance" in metrics) \
+                and len(data) >= NUMBA_MIN_SIZE:
+            nb = _numba_kernels()
+            if nb and all(type(x) is float for x in data):
+                arr = nb.to_array(data)
+                # inf/NaN 交回 statistics，維持原本的結果與錯誤行為
+                if nb.all_finite(arr):
+                    moments = nb.mean_m2(arr)
+
         if "mean" in metrics:
-            results["mean"] = statistics.mean(data)
+            results["mean"] = statistics.mean(data) if moments is None else moments[0]
         if "median" in metrics:
             results["median"] = statistics.median(data)
         if "mode" in metrics:
@@ -1529,9 +1975,15 @@ def statistical_analysis(
             except statistics.StatisticsError:
                 results["mode"] = None
         if "std" in metrics or "stdev" in metrics:
-            results["std"] = statistics.stdev(data) if len(data) > 1 else 0
+            if moments is None:
+                results["std"] = statistics.stdev(data) if len(data) > 1 else 0
+            else:
+                results["std"] = math.sqrt(moments[1] / (len(data) - 1))
         if "variance" in metrics:
-            results["variance"] = statistics.variance(data) if len(data) > 1 else 0
+            if moments is None:
+                results["variance"] = statistics.variance(data) if len(data) > 1 else 0
+            else:
+                results["variance"] = moments[1] / (len(data) - 1)
         if "min" in metrics:
             results["min"] = min(data)
         if "max" in metrics:
@@ -1543,17 +1995,37 @@ def statistical_analysis(
         if "range" in metrics:
             results["range"] = max(data) - min(data)
 
+        pct_metrics = []
         for metric in metrics:
             if metric.startswith("percentile_"):
                 try:
                     p = int(metric.split("_")[1])
-                    sorted_data = sorted(data)
-                    k = (len(sorted_data) - 1) * p / 100
-                    f = int(k)
-                    c = f + 1 if f + 1 < len(sorted_data) else f
-                    results[metric] = sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
                 except:
-                    pass
+                    continue
+                # 百分位數必須在 0–100（原本負值會經負索引外插出錯誤的值；numba 核心也不做邊界檢查）
+                if not 0 <= p <= 100:
+                    raise ValueError(f"Invalid percentile metric: {metric} (expected percentile_0 to percentile_100)")
+                pct_metrics.append((metric, p))
+
+        if pct_metrics:
+            nb = _numba_kernels() if len(data) >= NUMBA_MIN_SIZE else None
+            if nb:
+                sorted_arr = nb.sorted_array(data)
+                ps = nb.to_array([p for _, p in pct_metrics])
+                out = nb.empty(len(pct_metrics))
+                nb.percentiles(sorted_arr, ps, out)
+                for (metric, _), v in zip(pct_metrics, out.tolist()):
+                    results[metric] = v
+            else:
+                sorted_data = sorted(data)
+                for metric, p in pct_metrics:
+                    try:
+                        k = (len(sorted_data) - 1) * p / 100
+                        f = int(k)
+                        c = f + 1 if f + 1 < len(sorted_data) else f
+                        results[metric] = sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
+                    except:
+                        pass
 
         return {
             "success": True,
@@ -1617,11 +2089,22 @@ def correlation_analysis(
             y_use = y_values
 
         n = len(x_use)
-        sum_x = sum(x_use)
-        sum_y = sum(y_use)
-        sum_xy = sum(x * y for x, y in zip(x_use, y_use))
-        sum_x2 = sum(x ** 2 for x in x_use)
-        sum_y2 = sum(y ** 2 for y in y_use)
+        nb = _numba_kernels() if n >= NUMBA_MIN_SIZE else None
+        sums = None
+        # 與 statistical_analysis 相同：只有全為有限 float 時才走 numba，其餘（含 inf/NaN）交回 sum()
+        if nb and all(type(v) is float for v in x_use) and all(type(v) is float for v in y_use):
+            x_arr = nb.to_array(x_use)
+            y_arr = nb.to_array(y_use)
+            if nb.all_finite(x_arr) and nb.all_finite(y_arr):
+                sums = nb.pearson_sums(x_arr, y_arr)
+        if sums is not None:
+            sum_x, sum_y, sum_xy, sum_x2, sum_y2 = sums
+        else:
+            sum_x = sum(x_use)
+            sum_y = sum(y_use)
+            sum_xy = sum(x * y for x, y in zip(x_use, y_use))
+            sum_x2 = sum(x ** 2 for x in x_use)
+            sum_y2 = sum(y ** 2 for y in y_use)
 
         numerator = n * sum_xy - sum_x * sum_y
         denominator = ((n * sum_x2 - sum_x ** 2) * (n * sum_y2 - sum_y ** 2)) ** 0.5
@@ -1662,11 +2145,23 @@ def moving_average(
                 "error": "Invalid window size"
             }
 
-        result = []
-        for i in range(len(data) - window_size + 1):
-            window = data[i:i + window_size]
-            avg = sum(window) / window_size
-            result.append(avg)
+        nb = _numba_kernels() if len(data) >= NUMBA_MIN_SIZE else None
+        arr = None
+        # 只有全為有限 float 時才走 numba；int（可能超過 2**53）、bool、inf/NaN 交回純 Python
+        if nb and all(type(x) is float for x in data):
+            arr = nb.to_array(data)
+            if not nb.all_finite(arr):
+                arr = None
+        if arr is not None:
+            out = nb.empty(len(data) - window_size + 1)
+            nb.moving_avg(arr, window_size, out)
+            result = out.tolist()
+        else:
+            result = []
+            for i in range(len(data) - window_size + 1):
+                window = data[i:i + window_size]
+                avg = sum(window) / window_size
+                result.append(avg)
 
         return {
             "success": True,
@@ -1695,7 +2190,7 @@ def currency_converter(
 ) -> Dict[str, Any]:
     """Currency converter with SSRF protection and input validation."""
     try:
-        if not re.fullmatch(r"[A-Z]{3}", from_currency.upper()):
+        if not _CURRENCY_RE.fullmatch(from_currency.upper()):
             return {
                 "success": False,
                 "result": None,
@@ -1706,7 +2201,7 @@ def currency_converter(
                 "error": "Invalid from_currency code (must be 3 uppercase letters)"
             }
         
-        if not re.fullmatch(r"[A-Z]{3}", to_currency.upper()):
+        if not _CURRENCY_RE.fullmatch(to_currency.upper()):
             return {
                 "success": False,
                 "result": None,
@@ -1717,8 +2212,6 @@ def currency_converter(
                 "error": "Invalid to_currency code (must be 3 uppercase letters)"
             }
 
-        import requests
-
         from_currency = from_currency.upper()
         to_currency = to_currency.upper()
         url = f"https://api.exchangerate-api.com/v4/latest/{from_currency}"
@@ -1735,11 +2228,7 @@ def currency_converter(
                 "error": f"URL blocked: {msg}"
             }
 
-        session = _create_safe_session() or requests.Session()
-        response = session.get(url, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
+        data = _get_json_cached(url, CURRENCY_CACHE_TTL)
 
         if to_currency not in data['rates']:
             return {
@@ -1784,7 +2273,7 @@ def wikipedia_search(
 ) -> Dict[str, Any]:
     """Wikipedia search with language validation and domain allowlist."""
     try:
-        if not re.fullmatch(r"[a-z]{2,12}(-[a-z0-9]{2,12})?", language.lower()):
+        if not _LANG_RE.fullmatch(language.lower()):
             return {
                 "success": False,
                 "summary": None,
@@ -1794,8 +2283,6 @@ def wikipedia_search(
                 "error": "Invalid language code format"
             }
 
-        import requests
-
         query_encoded = urllib.parse.quote(query, safe="")
         url = f"https://{language.lower()}.wikipedia.org/api/rest_v1/page/summary/{query_encoded}"
         
@@ -1822,14 +2309,10 @@ def wikipedia_search(
                 "error": f"URL blocked: {msg}"
             }
         
-        session = _create_safe_session() or requests.Session()
-        response = session.get(url, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
+        data = _get_json_cached(url, API_CACHE_TTL)
 
         extract = data.get('extract', '')
-        sentences_list = extract.split('. ')[:sentences]
+        sentences_list = extract.split('. ', sentences)[:sentences]
         summary = '. '.join(sentences_list)
         if summary and not summary.endswith('.'):
             summary += '.'
@@ -1860,8 +2343,6 @@ def geocoding(
 ) -> Dict[str, Any]:
     """Geocoding with SSRF protection."""
     try:
-        import requests
-
         url = "https://nominatim.openstreetmap.org/search"
         
         ok, msg = _is_safe_url(url, ALLOWED_API_DOMAINS)
@@ -1882,11 +2363,7 @@ def geocoding(
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
         }
 
-        session = _create_safe_session() or requests.Session()
-        response = session.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
+        data = _get_json_cached(url, API_CACHE_TTL, params=params, headers=headers)
 
         if not data:
             return {
@@ -1943,12 +2420,22 @@ def create_csv(
 
         with open(filename, 'w', newline='', encoding='utf-8') as f:
             fieldnames = list(data[0].keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            fieldset = set(fieldnames)
+            writer = csv.writer(f)
+
+            def rows():
+                # 同 csv.DictWriter（restval=""、多餘欄位報錯），但不必每列建立差集
+                for row in data:
+                    if not row.keys() <= fieldset:
+                        wrong_fields = row.keys() - fieldset
+                        raise ValueError("dict contains fields not in fieldnames: "
+                                         + ", ".join([repr(x) for x in wrong_fields]))
+                    yield [row.get(key, "") for key in fieldnames]
 
             if include_header:
-                writer.writeheader()
+                writer.writerow(fieldnames)
 
-            writer.writerows(data)
+            writer.writerows(rows())
 
         return {
             "success": True,
@@ -2007,51 +2494,202 @@ def create_markdown(
         }
 
 
+class _Missing:
+    """validate_data 欄位缺值標記"""
+
+
+_MISSING = _Missing()
+
+
+def _compile_validation_rules(
+    rules: Dict[str, Dict[str, Any]]
+) -> List[Tuple[str, Optional[str], List[Tuple[Any, str]]]]:
+    """
+    validate_data 逐列版本用：每個 schema 只解析一次 rules。
+    回傳 [(field, required 訊息或 None, [(失敗判斷函數, 訊息), ...])]，檢查順序與訊息不變。
+    """
+    number = (int, float)
+    compiled = []
+    for field, rule in rules.items():
+        checks = []
+
+        expected_type = rule.get("type")
+        if expected_type == "integer":
+            checks.append((lambda v: not isinstance(v, int), f"Field '{field}' must be integer"))
+        elif expected_type == "float":
+            checks.append((lambda v: not isinstance(v, number), f"Field '{field}' must be number"))
+        elif expected_type == "string":
+            checks.append((lambda v: not isinstance(v, str), f"Field '{field}' must be string"))
+        elif expected_type == "email":
+            checks.append((lambda v, match=_EMAIL_RE.match: not match(str(v)),
+                           f"Field '{field}' must be valid email"))
+
+        if "min" in rule:
+            checks.append((lambda v, lo=rule["min"]: isinstance(v, number) and v < lo,
+                           f"Field '{field}' must be >= {rule['min']}"))
+        if "max" in rule:
+            checks.append((lambda v, hi=rule["max"]: isinstance(v, number) and v > hi,
+                           f"Field '{field}' must be <= {rule['max']}"))
+
+        if "min_length" in rule:
+            checks.append((lambda v, lo=rule["min_length"]: isinstance(v, str) and len(v) < lo,
+                           f"Field '{field}' length must be >= {rule['min_length']}"))
+        if "max_length" in rule:
+            checks.append((lambda v, hi=rule["max_length"]: isinstance(v, str) and len(v) > hi,
+                           f"Field '{field}' length must be <= {rule['max_length']}"))
+
+        required_msg = f"Field '{field}' is required" if rule.get("required", False) else None
+        compiled.append((field, required_msg, checks))
+    return compiled
+
+
+def _numpy_bounds(num: Any, rule: Dict[str, Any]) -> Optional[Tuple[Any, Any]]:
+    """
+    以 float64 陣列做 min/max 檢查，回傳 (below, above) 布林陣列（NaN 兩者皆 False）。
+    float64 無法精確表示時（|x| > 2**53 的整數）回傳 None，由 pandas 逐元素比較。
+    """
+    import numpy as np
+
+    exact = float(2 ** 53)
+    lo = rule.get("min", -np.inf)
+    hi = rule.get("max", np.inf)
+    for bound in (lo, hi):
+        if type(bound) not in (int, float) or (type(bound) is int and abs(bound) > exact):
+            return None
+    try:
+        arr = np.asarray(num.tolist(), dtype=np.float64)
+    except OverflowError:
+        return None
+    if (np.abs(arr) > exact).any() and not all(type(v) is float for v in num):
+        return None
+    return arr < float(lo), arr > float(hi)
+
+
+def _validate_data_vectorized(
+    data: List[Dict[str, Any]],
+    rules: Dict[str, Dict[str, Any]]
+) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    validate_data 的欄式批次版本（pandas/numpy 不存在時回傳 None）。
+    回傳 (invalid_count, 前 10 筆錯誤)，錯誤訊息與逐列版本一致。
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        return None
+
+    n = len(data)
+    checks = []  # (失敗遮罩, 訊息)，依逐列版本的檢查順序排列
+
+    for field, rule in rules.items():
+        col = pd.Series([item.get(field, _MISSING) for item in data], dtype=object)
+        types = col.map(type)
+        present = (types != _Missing).to_numpy(dtype=bool)
+
+        def isinst(classes):
+            lookup = {t: issubclass(t, classes) for t in types.unique()}
+            return types.map(lookup).to_numpy(dtype=bool) & present
+
+        def scatter(mask, sub_mask):
+            out = np.zeros(n, dtype=bool)
+            out[mask] = sub_mask
+            return out
+
+        if rule.get("required", False):
+            checks.append((~present, f"Field '{field}' is required"))
+
+        if "type" in rule:
+            expected_type = rule["type"]
+            if expected_type == "integer":
+                checks.append((present & ~isinst(int), f"Field '{field}' must be integer"))
+            elif expected_type == "float":
+                checks.append((present & ~isinst((int, float)), f"Field '{field}' must be number"))
+            elif expected_type == "string":
+                checks.append((present & ~isinst(str), f"Field '{field}' must be string"))
+            elif expected_type == "email":
+                # 整欄一次比對（直接傳入已編譯正則，不再重新解析 pattern）
+                ok = col[present].astype(str).str.match(_EMAIL_RE, na=False).to_numpy(dtype=bool)
+                checks.append((scatter(present, ~ok), f"Field '{field}' must be valid email"))
+
+        if "min" in rule or "max" in rule:
+            numeric = isinst((int, float))
+            num = col[numeric]
+            bounds = _numpy_bounds(num, rule)
+            if bounds is None:
+                below = (num < rule["min"]).to_numpy(dtype=bool) if "min" in rule else None
+                above = (num > rule["max"]).to_numpy(dtype=bool) if "max" in rule else None
+            else:
+                below, above = bounds
+            if "min" in rule:
+                checks.append((scatter(numeric, below),
+                               f"Field '{field}' must be >= {rule['min']}"))
+            if "max" in rule:
+                checks.append((scatter(numeric, above),
+                               f"Field '{field}' must be <= {rule['max']}"))
+
+        if "min_length" in rule or "max_length" in rule:
+            is_str = isinst(str)
+            lengths = col[is_str].str.len().to_numpy()
+            if "min_length" in rule:
+                checks.append((scatter(is_str, lengths < rule["min_length"]),
+                               f"Field '{field}' length must be >= {rule['min_length']}"))
+            if "max_length" in rule:
+                checks.append((scatter(is_str, lengths > rule["max_length"]),
+                               f"Field '{field}' length must be <= {rule['max_length']}"))
+
+    if not checks:
+        return 0, []
+
+    failed = np.logical_or.reduce([mask for mask, _ in checks])
+    errors = []
+    for i in np.flatnonzero(failed)[:10]:
+        errors.append({
+            "row": int(i),
+            "errors": [msg for mask, msg in checks if mask[i]]
+        })
+    return int(failed.sum()), errors
+
+
 def validate_data(
     data: List[Dict[str, Any]],
     rules: Dict[str, Dict[str, Any]]
 ) -> Dict[str, Any]:
-    """Validate data against rules."""
+    """Validate data against rules (pandas batch path for large inputs)."""
     try:
+        vectorized = None
+        if len(data) >= VALIDATE_VECTORIZE_MIN_ROWS:
+            vectorized = _validate_data_vectorized(data, rules)
+
+        if vectorized is not None:
+            invalid_count, errors = vectorized
+            return {
+                "success": True,
+                "is_valid": invalid_count == 0,
+                "valid_count": len(data) - invalid_count,
+                "invalid_count": invalid_count,
+                "total_count": len(data),
+                "errors": errors,
+                "error": None
+            }
+
         errors = []
         valid_count = 0
+        compiled = _compile_validation_rules(rules)
 
         for i, item in enumerate(data):
             item_errors = []
 
-            for field, rule in rules.items():
+            for field, required_msg, checks in compiled:
                 if field not in item:
-                    if rule.get("required", False):
-                        item_errors.append(f"Field '{field}' is required")
+                    if required_msg:
+                        item_errors.append(required_msg)
                     continue
 
                 value = item[field]
-
-                if "type" in rule:
-                    expected_type = rule["type"]
-                    if expected_type == "integer" and not isinstance(value, int):
-                        item_errors.append(f"Field '{field}' must be integer")
-                    elif expected_type == "float" and not isinstance(value, (int, float)):
-                        item_errors.append(f"Field '{field}' must be number")
-                    elif expected_type == "string" and not isinstance(value, str):
-                        item_errors.append(f"Field '{field}' must be string")
-                    elif expected_type == "email":
-                        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', str(value)):
-                            item_errors.append(f"Field '{field}' must be valid email")
-
-                if "min" in rule and isinstance(value, (int, float)):
-                    if value < rule["min"]:
-                        item_errors.append(f"Field '{field}' must be >= {rule['min']}")
-                if "max" in rule and isinstance(value, (int, float)):
-                    if value > rule["max"]:
-                        item_errors.append(f"Field '{field}' must be <= {rule['max']}")
-
-                if "min_length" in rule and isinstance(value, str):
-                    if len(value) < rule["min_length"]:
-                        item_errors.append(f"Field '{field}' length must be >= {rule['min_length']}")
-                if "max_length" in rule and isinstance(value, str):
-                    if len(value) > rule["max_length"]:
-                        item_errors.append(f"Field '{field}' length must be <= {rule['max_length']}")
+                for failed, message in checks:
+                    if failed(value):
+                        item_errors.append(message)
 
             if item_errors:
                 errors.append({
@@ -2092,26 +2730,35 @@ def compare_data(
 ) -> Dict[str, Any]:
     """Compare two datasets."""
     try:
+        differences_count = None
+
         if comparison_type == "exact":
-            is_equal = data1 == data2
+            # 單次掃描：完整計數，但只保留輸出會用到的前 10 筆差異
+            # 不改用序列化雜湊比對：1 / 1.0 / True 相等但序列化不同，NaN、tuple/list 則相反；
+            # 每列只比一次，== 本身已是 C 層級的單次走訪
             differences = []
-
-            if not is_equal:
-                for i, (item1, item2) in enumerate(zip(data1, data2)):
-                    if item1 != item2:
+            differences_count = 0
+            for i, (item1, item2) in enumerate(zip(data1, data2)):
+                if item1 is not item2 and item1 != item2:
+                    differences_count += 1
+                    if len(differences) < 10:
                         differences.append({
                             "row": i,
                             "data1": item1,
                             "data2": item2
                         })
 
-                if len(data1) != len(data2):
+            if len(data1) != len(data2):
+                differences_count += 1
+                if len(differences) < 10:
                     differences.append({
                         "type": "length_mismatch",
                         "data1_length": len(data1),
                         "data2_length": len(data2)
                     })
 
+            is_equal = differences_count == 0
+
         elif comparison_type == "structural":
             is_equal = True
             differences = []
@@ -2145,7 +2792,7 @@ def compare_data(
             "success": True,
             "is_equal": is_equal,
             "comparison_type": comparison_type,
-            "differences_count": len(differences),
+            "differences_count": len(differences) if differences_count is None else differences_count,
             "differences": differences[:10],
             "error": None
         }
@@ -2185,25 +2832,17 @@ def extract_information(
         extracted = []
 
         if extract_type == "numbers":
-            pattern = r'[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[eE][-+]?\d+)?'
-            extracted = re.findall(pattern, text)
+            extracted = _NUMBER_RE.findall(text)
 
         elif extract_type == "dates":
-            patterns = [
-                r'\d{4}-\d{2}-\d{2}',
-                r'\d{1,2}/\d{1,2}/\d{4}',
-                r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}'
-            ]
-            for p in patterns:
-                extracted.extend(re.findall(p, text, re.IGNORECASE))
+            for date_re in _DATE_RES:
+                extracted.extend(date_re.findall(text))
 
         elif extract_type == "urls":
-            pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-            extracted = re.findall(pattern, text)
+            extracted = [u for u in _URL_RE.findall(text) if len(u.partition('://')[2]) <= MAX_URL_CHARS]
 
         elif extract_type == "emails":
-            pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            extracted = re.findall(pattern, text)
+            extracted = _EMAIL_FIND_RE.findall(text)
 
         elif extract_type == "keywords":
             if not keywords:
@@ -2219,8 +2858,17 @@ def extract_information(
                     extracted.append(kw)
 
         elif extract_type == "sentences":
-            extracted = re.split(r'[.!?]+', text)
-            extracted = [s.strip() for s in extracted if s.strip()]
+            # 單次掃描，依終止符位置切片，每段只 strip 一次
+            extracted = []
+            prev = 0
+            for m in _SENT_RE.finditer(text):
+                seg = text[prev:m.start()].strip()
+                if seg:
+                    extracted.append(seg)
+                prev = m.end()
+            tail = text[prev:].strip()
+            if tail:
+                extracted.append(tail)
 
         elif extract_type == "custom":
             # B2 修正：使用 regex_search() 統一處理 ReDoS 防護
@@ -2275,24 +2923,43 @@ def count_occurrences(
 
         if isinstance(data, str):
             search_text = data if case_sensitive else data.lower()
-            for t in targets:
-                search_target = t if case_sensitive else t.lower()
-                if count_type == "exact":
-                    counts[t] = search_text.count(search_target)
-                elif count_type == "word":
-                    counts[t] = len(re.findall(r'\b' + re.escape(search_target) + r'\b', search_text))
-                elif count_type == "contains":
-                    counts[t] = search_text.count(search_target)
+            search_targets = [(t, t if case_sensitive else t.lower()) for t in targets]
+            if count_type in ("exact", "contains"):
+                counts = dict.fromkeys(targets, 0)
+                for t, st in search_targets:
+                    counts[t] = search_text.count(st)
+            elif count_type == "word":
+                counts = dict.fromkeys(targets, 0)
+                # 純 \w+ 目標的 \bT\b 命中恰為等於 T 的完整字詞，一次斷詞即可計數
+                if all(_WORD_RE.fullmatch(st) for _, st in search_targets):
+                    word_counts = Counter(_WORD_RE.findall(search_text))
+                    for t, st in search_targets:
+                        counts[t] = word_counts[st]
+                else:
+                    for t, st in search_targets:
+                        counts[t] = len(_word_boundary_re(st).findall(search_text))
 
         elif isinstance(data, list):
+            counts = dict.fromkeys(targets, 0)
             if case_sensitive:
-                for t in targets:
-                    counts[t] = data.count(t)
+                keys = targets
             else:
-                lowered = [x.lower() if isinstance(x, str) else x for x in data]
-                for t in targets:
-                    tl = t.lower() if isinstance(t, str) else t
-                    counts[t] = sum(1 for x in lowered if x == tl)
+                keys = [t.lower() if isinstance(t, str) else t for t in targets]
+
+            def items():
+                if case_sensitive:
+                    return iter(data)
+                return (x.lower() if isinstance(x, str) else x for x in data)
+
+            try:
+                # 一次掃描、逐項 lower 後直接計數，不建立中介 list
+                item_counts = Counter(items())
+                for t, k in zip(targets, keys):
+                    counts[t] = item_counts[k]
+            except TypeError:
+                # 含 unhashable 元素時退回逐一比較
+                for t, k in zip(targets, keys):
+                    counts[t] = sum(1 for x in items() if x == k)
 
         total = sum(counts.values())
 
@@ -2389,18 +3056,21 @@ def list_operations(
     try:
         op = (operation or "").lower()
 
-        def uniq(seq: List[Any]) -> List[Any]:
+        def uniq(seq: List[Any]) -> Tuple[List[Any], List[str]]:
+            """去重並回傳 (items, keys)，每個元素只 keyify 一次"""
             seen = set()
             out = []
+            keys = []
             for it in seq:
                 k = _keyify(it)
                 if k not in seen:
                     seen.add(k)
                     out.append(it)
-            return out
+                    keys.append(k)
+            return out, keys
 
         if op == "unique":
-            result = uniq(list1)
+            result, _ = uniq(list1)
 
         elif op in ["intersection", "union", "difference", "symmetric_difference"]:
             if list2 is None:
@@ -2412,35 +3082,25 @@ def list_operations(
                     "error": "list2 required for binary operations"
                 }
 
-            u1 = uniq(list1)
-            u2 = uniq(list2)
+            u1, k1 = uniq(list1)
+            u2, k2 = uniq(list2)
 
-            keys2 = set(_keyify(x) for x in u2)
-            keys1 = set(_keyify(x) for x in u1)
+            keys2 = set(k2)
 
             if op == "intersection":
-                result = [x for x in u1 if _keyify(x) in keys2]
+                result = [x for x, k in zip(u1, k1) if k in keys2]
 
             elif op == "difference":
-                result = [x for x in u1 if _keyify(x) not in keys2]
+                result = [x for x, k in zip(u1, k1) if k not in keys2]
 
             elif op == "union":
-                result = list(u1)
-                seen = set(_keyify(x) for x in result)
-                for x in u2:
-                    k = _keyify(x)
-                    if k not in seen:
-                        seen.add(k)
-                        result.append(x)
+                keys1 = set(k1)
+                result = u1 + [x for x, k in zip(u2, k2) if k not in keys1]
 
             elif op == "symmetric_difference":
-                result = [x for x in u1 if _keyify(x) not in keys2]
-                seen = set(_keyify(x) for x in result)
-                for x in u2:
-                    k = _keyify(x)
-                    if k not in keys1 and k not in seen:
-                        seen.add(k)
-                        result.append(x)
+                keys1 = set(k1)
+                result = [x for x, k in zip(u1, k1) if k not in keys2]
+                result.extend(x for x, k in zip(u2, k2) if k not in keys1)
         else:
             return {
                 "success": False,
@@ -2488,27 +3148,17 @@ def find_in_text(
         terms = [search_terms] if isinstance(search_terms, str) else search_terms
         matches = []
 
-        line_starts = _build_line_index(text)
-
-        for term in terms:
-            if len(matches) >= max_results:
-                break
-
-            pattern = re.compile(re.escape(term))
-            for m in pattern.finditer(text):
-                pos = m.start()
-
+        if max_results > 0:
+            for term, pos in _iter_term_positions(text, terms, max_results):
                 start = max(0, pos - context_chars)
                 end = min(len(text), pos + len(term) + context_chars)
                 context = text[start:end]
 
-                line_number = _find_line_number(pos, line_starts)
-
                 matches.append({
                     "term": term,
                     "position": pos,
                     "context": context,
-                    "line_number": line_number,
+                    "line_number": None,
                     "match_text": term,
                     "span": [pos, pos + len(term)]
                 })
@@ -2516,6 +3166,13 @@ def find_in_text(
                 if len(matches) >= max_results:
                     break
 
+        # 有命中才建行索引，並一次解析所有行號
+        if matches:
+            line_starts = _build_line_index(text)
+            line_numbers = _find_line_numbers([m["position"] for m in matches], line_starts)
+            for m, line_number in zip(matches, line_numbers):
+                m["line_number"] = line_number
+
         return {
             "success": True,
             "matches": matches,
@@ -2559,48 +3216,53 @@ def read_xml(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
         except ImportError:
             import xml.etree.ElementTree as ET
         
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        # C4: 增加深度和節點計數檢查
-        node_count = [0]  # 使用 list 作為可變容器
-        
-        def element_to_dict(element, depth=0):
-            """Recursively convert XML element to dict with limits."""
-            if depth > MAX_XML_DEPTH:
-                raise ValueError(f"XML nesting too deep (max {MAX_XML_DEPTH})")
-            
-            node_count[0] += 1
-            if node_count[0] > MAX_XML_NODES:
-                raise ValueError(f"Too many XML nodes (max {MAX_XML_NODES})")
-            
-            result = {}
-            
-            if element.attrib:
-                result['@attributes'] = element.attrib
-            
-            if element.text and element.text.strip():
-                if len(element) == 0:
-                    return element.text.strip()
-                result['#text'] = element.text.strip()
-            
-            children = {}
-            for child in element:
-                child_data = element_to_dict(child, depth + 1)
-                
-                if child.tag in children:
-                    if not isinstance(children[child.tag], list):
-                        children[child.tag] = [children[child.tag]]
-                    children[child.tag].append(child_data)
+        # C4: 串流解析，解析時即檢查深度與節點數；處理完的元素立即 clear() 釋放
+        stack = []  # [(element, {tag: [child_value, ...]})]
+        node_count = 0
+        root = None
+        root_value = None
+
+        for event, element in ET.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                if len(stack) > MAX_XML_DEPTH:
+                    raise ValueError(f"XML nesting too deep (max {MAX_XML_DEPTH})")
+                node_count += 1
+                if node_count > MAX_XML_NODES:
+                    raise ValueError(f"Too many XML nodes (max {MAX_XML_NODES})")
+                if root is None:
+                    root = element
+                stack.append((element, {}))
+                continue
+
+            element, children = stack.pop()
+            text = element.text.strip() if element.text else ""
+
+            if text and len(element) == 0:
+                value = text
+            else:
+                value = {}
+                if element.attrib:
+                    value['@attributes'] = dict(element.attrib)
+                if text:
+                    value['#text'] = text
+                # 同名子節點先一律收進 list，父節點結束時再把單一元素攤平
+                for tag, bucket in children.items():
+                    value[tag] = bucket[0] if len(bucket) == 1 else bucket
+
+            if stack:
+                siblings = stack[-1][1]
+                bucket = siblings.get(element.tag)
+                if bucket is None:
+                    siblings[element.tag] = [value]
                 else:
-                    children[child.tag] = child_data
-            
-            result.update(children)
-            
-            return result
-        
+                    bucket.append(value)
+            else:
+                root_value = value
+
+            element.clear()
+
         data = {
-            root.tag: element_to_dict(root)
+            root.tag: root_value
         }
         
         return {
@@ -2647,8 +3309,9 @@ def extract_zip(
             os.makedirs(extract_dir, exist_ok=True)
         
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            total_size = sum(info.file_size for info in zip_ref.infolist())
-            if total_size > MAX_ZIP_SIZE * 10:
+            infos = zip_ref.infolist()
+            bomb_error = _check_zip_bomb(infos)
+            if bomb_error:
                 if extract_to is None and os.path.exists(extract_dir):
                     shutil.rmtree(extract_dir, ignore_errors=True)
                 return {
@@ -2656,24 +3319,26 @@ def extract_zip(
                     "extract_path": extract_dir,
                     "files": [],
                     "count": 0,
-                    "error": f"Uncompressed size too large (potential zip bomb)"
+                    "error": bomb_error
                 }
             
             # 使用安全解壓函數
             _safe_extract_zip(zip_ref, extract_dir, password)
         
-        # P0-2: 從實際解壓的目錄掃描文件
+        # P0-2: 檔案清單直接取自已驗證的 infolist（不再 rglob + stat 整個目錄）
         extracted_files = []
         base = Path(extract_dir).resolve()
         
-        for file_path in base.rglob("*"):
-            if file_path.is_file():
-                extracted_files.append({
-                    "filename": str(file_path.relative_to(base)).replace("\\", "/"),
-                    "path": str(file_path),
-                    "size": file_path.stat().st_size,
-                    "compressed_size": None
-                })
+        for info in infos:
+            if info.is_dir():
+                continue
+            name = info.filename.replace("\\", "/")
+            extracted_files.append({
+                "filename": name,
+                "path": str(base / name),
+                "size": info.file_size,
+                "compressed_size": info.compress_size
+            })
         
         return {
             "success": True,
@@ -2746,6 +3411,65 @@ GAIA_TOOLS = {
     "extract_zip": extract_zip,
 }
 
+
+def call_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """依名稱分派到 GAIA_TOOLS（單次 dict 查找；只允許登錄的工具）"""
+    func = GAIA_TOOLS.get(name)
+    if func is None:
+        return {"success": False, "error": f"Unknown tool: {name}"}
+    return func(**arguments)
+
+
+# 受網路延遲主導的工具：批次呼叫時以執行緒並行
+NETWORK_TOOLS = frozenset({
+    "web_search", "web_fetch", "wikipedia_search", "geocoding", "currency_converter",
+})
+
+
+def call_tools(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    批次執行 [(name, arguments), ...]，結果順序與 calls 相同。
+    多個 web_search 合併為一次批次請求；其餘網路工具並行送出（總延遲約為最慢的一個），
+    非網路工具在呼叫端依序執行。
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(name, arguments):
+        try:
+            return call_tool(name, arguments)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    results: List[Any] = [None] * len(calls)
+
+    # 兩個以上 web_search：合併成一次 Serper 批次請求
+    searches = [i for i, (name, arguments) in enumerate(calls)
+                if name == "web_search" and isinstance(arguments.get("query"), str)
+                and arguments.keys() <= {"query", "num_results"}]
+    if len(searches) > 1:
+        batch = _web_search_batch([(calls[i][1]["query"], calls[i][1].get("num_results", 5))
+                                   for i in searches])
+        if batch is not None:
+            for i, res in zip(searches, batch):
+                results[i] = res
+
+    network = [i for i, (name, _) in enumerate(calls)
+               if name in NETWORK_TOOLS and results[i] is None]
+    if len(network) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_TOOL_WORKERS, len(network))) as ex:
+            futures = {i: ex.submit(run, *calls[i]) for i in network}
+            for i, (name, arguments) in enumerate(calls):
+                if i not in futures and results[i] is None:
+                    results[i] = run(name, arguments)
+            for i, fut in futures.items():
+                results[i] = fut.result()
+    else:
+        for i, (name, arguments) in enumerate(calls):
+            if results[i] is None:
+                results[i] = run(name, arguments)
+    return results
+
+
 GAIA_TOOL_SCHEMAS = {
     "read_pdf": {
         "description": "Read PDF file and extract text content",
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+GAIA Function Tools - Numba 數值核心（選用）
+
+statistical_analysis / moving_average / correlation_analysis 的大資料路徑。
+未安裝 numba/numpy 時 import 會失敗，gaia_function 會自動退回純 Python。
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def moving_avg(arr, w, out):
+    """
+    滑動平均，out 長度為 arr.size - w + 1。
+    每個視窗以 Neumaier 補償加總重新計算：running sum 的 acc += arr[i] - arr[i - w]
+    遇到極大值時會抵銷掉小數值，誤差之後不會恢復。
+    """
+    for s in range(arr.size - w + 1):
+        acc = 0.0
+        comp = 0.0
+        for i in range(s, s + w):
+            x = arr[i]
+            t = acc + x
+            if abs(acc) >= abs(x):
+                comp += (acc - t) + x
+            else:
+                comp += (x - t) + acc
+            acc = t
+        out[s] = (acc + comp) / w
+
+
+@njit(cache=True)
+def pearson_sums(x, y):
+    """單次掃描計算 (sum_x, sum_y, sum_xy, sum_x2, sum_y2)"""
+    sx = 0.0
+    sy = 0.0
+    sxy = 0.0
+    sx2 = 0.0
+    sy2 = 0.0
+    for i in range(x.size):
+        xi = x[i]
+        yi = y[i]
+        sx += xi
+        sy += yi
+        sxy += xi * yi
+        sx2 += xi * xi
+        sy2 += yi * yi
+    return sx, sy, sxy, sx2, sy2
+
+
+@njit(cache=True)
+def mean_m2(arr):
+    """兩次掃描回傳 (mean, M2)，M2 = Σ(x - mean)²；variance = M2 / (n - 1)"""
+    n = arr.size
+    acc = 0.0
+    for i in range(n):
+        acc += arr[i]
+    mean = acc / n
+    m2 = 0.0
+    for i in range(n):
+        d = arr[i] - mean
+        m2 += d * d
+    return mean, m2
+
+
+@njit(cache=True)
+def percentiles(sorted_arr, ps, out):
+    """線性內插百分位數（sorted_arr 需已排序）"""
+    n = sorted_arr.size
+    for j in range(ps.size):
+        k = (n - 1) * ps[j] / 100.0
+        f = int(k)
+        c = f + 1 if f + 1 < n else f
+        out[j] = sorted_arr[f] + (k - f) * (sorted_arr[c] - sorted_arr[f])
+
+
+def to_array(values):
+    """list → float64 連續陣列"""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def sorted_array(values):
+    """排序後的 float64 副本（不修改輸入）"""
+    return np.sort(np.asarray(values, dtype=np.float64))
+
+
+def all_finite(arr):
+    return bool(np.isfinite(arr).all())
+
+
+def empty(n):
+    return np.empty(n, dtype=np.float64)
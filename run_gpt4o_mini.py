@@ -21,7 +21,6 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import time
-import traceback
 
 # 引入您的 43 個 GAIA functions
 import gaia_function
@@ -57,34 +56,6 @@ class GAIARunner:
 
         print(f"✓ 已載入 {len(self.tools_schema)} 個 tools")
 
-    def execute_tool(self, tool_name: str, arguments: Dict) -> Dict:
-        """執行單一工具"""
-        try:
-            # 取得實際的 function
-            if tool_name not in self.tool_map:
-                return {
-                    "success": False,
-                    "error": f"未知工具：{tool_name}"
-                }
-
-            func = getattr(gaia_function, tool_name)
-
-            # 執行
-            result = func(**arguments)
-
-            return {
-                "success": True,
-                "result": result,
-                "error": None
-            }
-
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-
     def run_single_task(
         self,
         task: Dict,
@@ -191,15 +162,27 @@ class GAIARunner:
                         "elapsed_time": time.time() - start_time
                     }
 
-                # 執行 tool calls
-                for tool_call in assistant_message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = json.loads(tool_call.function.arguments)
+                # 執行 tool calls（整輪交給 gaia_function.call_tools：網路工具並行送出，結果仍依原順序處理）
+                calls = [
+                    (tool_call, tool_call.function.name, json.loads(tool_call.function.arguments))
+                    for tool_call in assistant_message.tool_calls
+                ]
+                known = [i for i, c in enumerate(calls) if c[1] in self.tool_map]
+                results = dict(zip(known, gaia_function.call_tools([(calls[i][1], calls[i][2]) for i in known])))
 
+                for i, (tool_call, tool_name, tool_args) in enumerate(calls):
                     print(f"  [{turn}] 🔧 {tool_name}({json.dumps(tool_args, ensure_ascii=False)[:60]}...)")
 
                     # 執行
-                    tool_result = self.execute_tool(tool_name, tool_args)
+                    if i in results:
+                        result = results[i]
+                        # call_tools 把工具拋出的例外轉成 {success: False, error}，視為失敗
+                        if isinstance(result, dict) and result.get("success") is False:
+                            tool_result = {"success": False, "result": result, "error": str(result.get("error") or "")}
+                        else:
+                            tool_result = {"success": True, "result": result, "error": None}
+                    else:
+                        tool_result = {"success": False, "error": f"未知工具：{tool_name}"}
 
                     if tool_result["success"]:
                         print(f"       ✓ 成功")
@@ -121,7 +121,8 @@ def main():
         '_keyify', '_check_int_size', '_is_within_directory',
         '_is_zipinfo_symlink', '_is_domain_allowed', '_is_safe_url',
         '_safe_extract_zip', '_create_safe_session', '_build_line_index',
-        '_find_line_number', '_rankdata', 'eval_node', 'uniq', 'element_to_dict'
+        '_find_line_numbers', '_rankdata', 'eval_node', 'uniq', 'element_to_dict',
+        'call_tool', 'call_tools'
     }
 
     # 取得所有 public functions